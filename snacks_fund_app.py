@@ -1,14 +1,151 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
-import matplotlib.pyplot as plt
-import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime
 import sys
 
 st.set_page_config(page_title="Snacks Fund Dashboard", layout="wide", page_icon="💰")
 
+# Balance series longer than this are downsampled to this many points
+BALANCE_MAX_POINTS = 5_000
+
+# Parquet metadata key holding the workbook mtime and size a sidecar was built from
+SIDECAR_SOURCE_KEY = b'snacks_fund_source'
+
+REQUIRED_COLUMNS = ['Date', 'Contributors', 'Spend', 'Contribution', 'Balance']
+COLUMN_DTYPES = {
+    'Contributors': 'category',
+    'Spend': 'float64',
+    'Contribution': 'float64',
+    'Balance': 'float64'
+}
+
+def read_fund_workbook(path):
+    """Parse the fund workbook with the Rust-based calamine reader"""
+    # calamine reads cached cell values without building a workbook object
+    # model, usecols skips cells in columns the dashboard never looks at and
+    # the explicit dtypes spare pandas its type inference passes
+    df = pd.read_excel(path, engine="calamine",
+                       usecols=lambda col: col in REQUIRED_COLUMNS,
+                       dtype=COLUMN_DTYPES)
+    # calamine already returns real date cells as datetime64, so only convert
+    # when needed; parse_dates is not used because it raises on a missing
+    # column, hiding the required-column message in main()
+    if 'Date' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['Date']):
+        df['Date'] = pd.to_datetime(df['Date'])
+    return df
+
+# The data caches keep only the current workbook revision, so saving the
+# workbook does not leave the previous frames resident
+@st.cache_data(show_spinner=False, max_entries=1)
+def load_fund_data(path, mtime):
+    """Read the fund data; mtime is part of the cache key so edits invalidate it
+
+    A Parquet copy of the workbook is kept next to it, since parsing xlsx is
+    far slower. The sidecar records the workbook's mtime and size it was built
+    from and is only used while both still match exactly.
+    """
+    # Stat before parsing so a save during the parse leaves a mismatching stamp
+    stat = os.stat(path)
+    source = f"{stat.st_mtime_ns}:{stat.st_size}".encode()
+    pq_path = path + ".parquet"
+    if os.path.exists(pq_path):
+        try:
+            import pyarrow.parquet as pq
+            metadata = pq.read_schema(pq_path).metadata or {}
+            if metadata.get(SIDECAR_SOURCE_KEY) == source:
+                # astype is a no-op unless the sidecar predates a dtype change
+                return pq.read_table(pq_path).to_pandas().astype(COLUMN_DTYPES)
+        except Exception:
+            pass  # Unreadable, outdated or pyarrow missing, fall back to the workbook
+    
+    df = read_fund_workbook(path)
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**table.schema.metadata, SIDECAR_SOURCE_KEY: source})
+        pq.write_table(table, pq_path, compression="snappy")
+    except (ImportError, OSError):
+        pass  # The sidecar is only an optimisation
+    return df
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def monthly_agg(df):
+    """Monthly contribution and spending totals"""
+    # A single resample is deliberate: it takes tens of ms even at millions of
+    # rows, about what shipping pickled slices to worker processes would cost
+    return df.resample('M', on='Date').agg({
+        'Contribution': 'sum',
+        'Spend': 'sum'
+    }).reset_index()
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def contrib_by_person(df):
+    """Total contribution per contributor, largest first; contributors with nothing paid in are dropped"""
+    # Weighted histogram over the category codes, equivalent to a groupby sum
+    # (rows without a contributor have code -1 and are skipped)
+    categories = df['Contributors'].cat.categories
+    codes = df['Contributors'].cat.codes.to_numpy()
+    contrib = df['Contribution'].to_numpy()
+    valid = (codes >= 0) & (contrib > 0)
+    sums = np.bincount(codes[valid], weights=contrib[valid], minlength=len(categories))
+    out = pd.DataFrame({'Contributors': categories, 'Contribution': sums})
+    out = out[out['Contribution'] > 0]
+    return out.sort_values('Contribution', ascending=False, kind='mergesort').reset_index(drop=True)
+
+# Each entry is a full CSV copy of a filter selection, so only the last few
+# selections are kept
+@st.cache_data(show_spinner=False, max_entries=4)
+def export_csv(df):
+    """CSV bytes for the export download, reused until the filtered data changes"""
+    return df.to_csv(index=False).encode("utf-8")
+
+# The charts only depend on the unfiltered data, so the figures themselves are
+# cached and reruns triggered by the filter widgets reuse them. Only the
+# figures for the current workbook are kept. A hit only saves construction,
+# since st.plotly_chart still serialises the figure on every rerun
+@st.cache_resource(show_spinner=False, max_entries=1)
+def build_balance_fig(df):
+    """Balance over time line chart"""
+    trace = go.Scattergl(name='Balance', mode='lines+markers')
+    if len(df) <= BALANCE_MAX_POINTS:
+        fig = go.Figure(data=[trace.update(x=df['Date'], y=df['Balance'])])
+    else:
+        # Downsampled server-side so the browser only receives a bounded number
+        # of points. plotly-resampler re-resamples on zoom through a Dash
+        # callback, which Streamlit does not have, so zooming in only shows
+        # this initial downsampled view. Imported here because it pulls in
+        # Dash, which is slow to import and not needed for small sheets.
+        from plotly_resampler import FigureResampler
+        fig = FigureResampler(go.Figure(), default_n_shown_samples=BALANCE_MAX_POINTS)
+        fig.add_trace(trace, hf_x=df['Date'], hf_y=df['Balance'])
+    fig.update_layout(xaxis_title="Date", yaxis_title="Balance")
+    return fig
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def build_contrib_fig(df):
+    """Bar chart of total contribution per contributor"""
+    contrib_data = contrib_by_person(df)
+    fig = go.Figure(data=[go.Bar(x=contrib_data['Contributors'], y=contrib_data['Contribution'])])
+    fig.update_layout(xaxis_title="Contributors", yaxis_title="Contribution")
+    return fig
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def build_monthly_fig(df):
+    """Grouped bar chart of monthly contributions and spending"""
+    monthly_data = monthly_agg(df)
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=monthly_data['Date'], y=monthly_data['Contribution'], name='Contributions'))
+    fig.add_trace(go.Bar(x=monthly_data['Date'], y=monthly_data['Spend'], name='Spending'))
+    return fig
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def build_pie_fig(total_contributions, total_spending):
+    """Pie chart of total contributions against total spending"""
+    return go.Figure(data=[go.Pie(labels=['Contributions', 'Spending'], values=[total_contributions, total_spending])])
+
 def main():
     # File path hardcoded
     file_path = os.path.join(os.path.dirname(__file__), "Snacks_Fund.xlsx")
@@ -21,26 +158,22 @@ def main():
         return
     
     try:
-        # Read the Excel file
-        df = pd.read_excel(file_path)
+        # Read the Excel file (cached until the workbook is modified)
+        df = load_fund_data(file_path, os.path.getmtime(file_path))
         
         # Ensure required columns exist
-        required_columns = ['Date', 'Contributors', 'Spend', 'Contribution', 'Balance']
-        for col in required_columns:
+        for col in REQUIRED_COLUMNS:
             if col not in df.columns:
                 st.error(f"Required column '{col}' not found in Excel file")
                 wait_for_exit()
                 return
         
-        # Convert Date column to datetime
-        df['Date'] = pd.to_datetime(df['Date'])
-        
         # App title and description
         st.title("💰 Snacks Fund Dashboard")
         st.markdown("### Fund Performance and Management Overview")
         
         # Display summary metrics
-        display_summary_metrics(df)
+        total_contributions, total_spending, _, _ = display_summary_metrics(df)
         
         # Create two columns for charts
         col1, col2 = st.columns(2)
@@ -48,34 +181,23 @@ def main():
         with col1:
             # Balance over time chart
             st.subheader("Balance Over Time")
-            fig_balance = px.line(df, x='Date', y='Balance', markers=True)
-            fig_balance.update_layout(xaxis_title="Date", yaxis_title="Balance")
+            fig_balance = build_balance_fig(df)
             st.plotly_chart(fig_balance, use_container_width=True)
             
             # Contributions by contributor
             st.subheader("Contributions by Contributor")
-            contrib_by_person = df[df['Contribution'] > 0].groupby('Contributors')['Contribution'].sum().reset_index()
-            contrib_by_person = contrib_by_person[contrib_by_person['Contribution'] > 0]
-            fig_contrib = px.bar(contrib_by_person, x='Contributors', y='Contribution')
+            fig_contrib = build_contrib_fig(df)
             st.plotly_chart(fig_contrib, use_container_width=True)
         
         with col2:
             # Contributions vs Spending over time
             st.subheader("Contributions vs Spending")
-            monthly_data = df.resample('M', on='Date').agg({
-                'Contribution': 'sum',
-                'Spend': 'sum'
-            }).reset_index()
-            fig_monthly = go.Figure()
-            fig_monthly.add_trace(go.Bar(x=monthly_data['Date'], y=monthly_data['Contribution'], name='Contributions'))
-            fig_monthly.add_trace(go.Bar(x=monthly_data['Date'], y=monthly_data['Spend'], name='Spending'))
+            fig_monthly = build_monthly_fig(df)
             st.plotly_chart(fig_monthly, use_container_width=True)
             
             # Pie chart for spending vs contributions
             st.subheader("Total Spending vs Contributions")
-            total_contrib = df['Contribution'].sum()
-            total_spend = df['Spend'].sum()
-            fig_pie = px.pie(values=[total_contrib, total_spend], names=['Contributions', 'Spending'])
+            fig_pie = build_pie_fig(total_contributions, total_spending)
             st.plotly_chart(fig_pie, use_container_width=True)
         
         # Display detailed transaction data
@@ -84,30 +206,35 @@ def main():
         # Add filters
         col1, col2, col3 = st.columns(3)
         with col1:
+            # The ledger stays in sheet order (Balance is a running total), so
+            # the bounds are a min/max rather than the first and last rows
             min_date = df['Date'].min().date()
             max_date = df['Date'].max().date()
             start_date = st.date_input("Start Date", min_date)
             end_date = st.date_input("End Date", max_date)
         
         with col2:
-            contributors = ['All'] + sorted(df['Contributors'].unique().tolist())
+            # Categories of the Contributors column are already sorted and unique
+            contributors = ['All'] + df['Contributors'].cat.categories.tolist()
             selected_contributor = st.selectbox("Contributor", contributors)
         
         with col3:
             transaction_type = st.selectbox("Transaction Type", ["All", "Contribution", "Spending"])
         
-        # Filter data based on selections
-        filtered_df = df.copy()
-        filtered_df = filtered_df[(filtered_df['Date'].dt.date >= start_date) & 
-                                 (filtered_df['Date'].dt.date <= end_date)]
+        # Filter data based on selections, building one mask and indexing once
+        start_ts = pd.Timestamp(start_date)
+        end_ts = pd.Timestamp(end_date) + pd.Timedelta(days=1)
+        mask = (df['Date'] >= start_ts) & (df['Date'] < end_ts)
         
         if selected_contributor != 'All':
-            filtered_df = filtered_df[filtered_df['Contributors'] == selected_contributor]
+            mask &= df['Contributors'] == selected_contributor
         
         if transaction_type == "Contribution":
-            filtered_df = filtered_df[filtered_df['Contribution'] > 0]
+            mask &= df['Contribution'] > 0
         elif transaction_type == "Spending":
-            filtered_df = filtered_df[filtered_df['Spend'] > 0]
+            mask &= df['Spend'] > 0
+        
+        filtered_df = df.loc[mask]
         
         # Display the filtered dataframe
         st.dataframe(filtered_df.style.format({
@@ -116,11 +243,12 @@ def main():
             'Balance': '₹{:.2f}'
         }), use_container_width=True)
         
-        # Export functionality
-        if st.button("Export Filtered Data"):
-            export_path = os.path.join(os.path.dirname(file_path), "exported_fund_data.xlsx")
-            filtered_df.to_excel(export_path, index=False)
-            st.success(f"Data exported to {export_path}")
+        # Export functionality (CSV, to_excel's per-cell styling makes xlsx export slow);
+        # served from memory so nothing is written on the server. download_button
+        # needs its data up front, so the CSV is built whenever the filters
+        # change rather than on click; that is the known cost of this widget
+        st.download_button("Export Filtered Data", export_csv(filtered_df),
+                           file_name="exported_fund_data.csv", mime="text/csv")
         
     except Exception as e:
         st.error(f"Error: {str(e)}")
@@ -128,24 +256,31 @@ def main():
         return
 
 def display_summary_metrics(df):
+    # Work on the underlying arrays so each column is only traversed once
+    contrib = df['Contribution'].to_numpy()
+    spend = df['Spend'].to_numpy()
+    balance = df['Balance'].to_numpy()
+    total_contributions = np.nansum(contrib)
+    total_spending = np.nansum(spend)
+    current_balance = balance[-1] if balance.size else 0
+    valid_contributors = df.loc[contrib > 0, 'Contributors'].nunique()
+    
     # Create four columns for metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_contributions = df['Contribution'].sum()
         st.metric("Total Contributions", f"₹{total_contributions:,.2f}")
     
     with col2:
-        total_spending = df['Spend'].sum()
         st.metric("Total Spending", f"₹{total_spending:,.2f}")
     
     with col3:
-        current_balance = df['Balance'].iloc[-1] if not df.empty else 0
         st.metric("Current Balance", f"₹{current_balance:,.2f}")
     
     with col4:
-        valid_contributors = df[df['Contribution'] > 0]['Contributors'].nunique()
         st.metric("Number of Contributors", valid_contributors)
+    
+    return total_contributions, total_spending, current_balance, valid_contributors
 
 def wait_for_exit():
     """Wait for Enter key to exit when running from command line"""